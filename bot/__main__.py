@@ -14,11 +14,25 @@ import asyncio
 import logging
 import signal
 import sys
+from pathlib import Path
 
 from aiogram import Bot, Dispatcher
+from aiogram.client.default import DefaultBotProperties
+from aiogram.client.session.aiohttp import AiohttpSession
+from aiogram.enums import ParseMode
 from aiohttp import web
 
+try:
+    # libuv's subprocess and pipe handling is markedly faster than stock
+    # asyncio's, and this workload is dominated by yt-dlp/ffprobe subprocess
+    # pipes plus Telegram HTTP. Not available on Windows; the stock loop is
+    # the dev fallback there.
+    import uvloop
+except ImportError:  # pragma: no cover - uvloop is a hard dep on Linux
+    uvloop = None
+
 from bot.config import Config
+from bot.downloader import flush_pending_cleanup, sweep_temp_dir
 from bot.handlers import router
 from bot.health import health_handler
 from bot.stats import GoogleSheetsStats
@@ -26,6 +40,14 @@ from bot.webhook import make_webhook_handler
 
 logger = logging.getLogger(__name__)
 
+# Update types the handlers actually consume. Resolved statically — the
+# router only registers message handlers plus callback queries — so there is
+# nothing to recompute per startup.
+ALLOWED_UPDATES = ["message", "callback_query"]
+
+# How often to sweep the temp dir for downloads orphaned by a crash.
+TEMP_SWEEP_INTERVAL_SECONDS = 3600.0
+
 
 def _configure_logging(level_name: str) -> None:
     """Configure the root logger to write to stdout with the requested level.
@@ -63,12 +85,12 @@ async def _ensure_webhook(bot: Bot, config: Config) -> None:
         logger.warning("WEBHOOK_URL not set — skipping setWebhook (dev mode)")
         return
 
-    logger.info(f"Registering webhook: {config.webhook_url!r}")
+    logger.info("Registering webhook: %r", config.webhook_url)
     await bot.set_webhook(
         url=config.webhook_url,
         secret_token=config.webhook_secret,
         drop_pending_updates=False,
-        allowed_updates=["message", "callback_query"],
+        allowed_updates=ALLOWED_UPDATES,
     )
 
 
@@ -102,6 +124,18 @@ def _build_app(
     return app
 
 
+async def _periodic_temp_sweep(temp_dir: Path) -> None:
+    """Sweep the temp dir for stale downloads once per interval, forever.
+
+    :param temp_dir: Directory holding per-download subdirectories.
+    :type temp_dir: Path
+    :return: None
+    """
+    while True:
+        await asyncio.sleep(TEMP_SWEEP_INTERVAL_SECONDS)
+        await sweep_temp_dir(temp_dir=temp_dir)
+
+
 async def _run() -> None:
     """Run the HTTP server until a termination signal is received.
 
@@ -112,11 +146,31 @@ async def _run() -> None:
 
     logger.info("Bot starting")
     config.temp_dir.mkdir(parents=True, exist_ok=True)
-    logger.info(f"Temp directory: {config.temp_dir}")
+    logger.info("Temp directory: %s", config.temp_dir)
 
-    stats_tracker = GoogleSheetsStats()
+    # Scrub downloads orphaned by a previous crash, then keep the temp dir
+    # small in the background for the process lifetime.
+    await sweep_temp_dir(temp_dir=config.temp_dir)
+    sweep_task = asyncio.create_task(
+        _periodic_temp_sweep(temp_dir=config.temp_dir)
+    )
 
-    bot = Bot(token=config.telegram_bot_token)
+    stats_tracker = GoogleSheetsStats()
+    # Pay the Sheets TLS/OAuth cost now, in the background, instead of inside
+    # the first user-facing request.
+    warmup_task = asyncio.create_task(stats_tracker.warmup())
+
+    # One explicit HTTP session for the whole process lifetime: every
+    # Telegram API call (including large video uploads) reuses its pooled
+    # keep-alive connections instead of paying a fresh TLS handshake.
+    session = AiohttpSession()
+    bot = Bot(
+        token=config.telegram_bot_token,
+        session=session,
+        # HTML is the only parse mode used anywhere; setting it once here
+        # removes the per-call parse_mode kwarg from the handlers.
+        default=DefaultBotProperties(parse_mode=ParseMode.HTML),
+    )
     dispatcher = Dispatcher()
     dispatcher.include_router(router=router)
 
@@ -135,13 +189,13 @@ async def _run() -> None:
         shutdown_timeout=config.shutdown_timeout_seconds,
     )
     await site.start()
-    logger.info(f"HTTP server listening on 0.0.0.0:{config.port}")
+    logger.info("HTTP server listening on 0.0.0.0:%s", config.port)
 
     try:
         await _ensure_webhook(bot=bot, config=config)
     except Exception as e:
         # Don't crash on Telegram API hiccups at startup — /health must stay up.
-        logger.error(f"Failed to ensure webhook: {e}")
+        logger.error("Failed to ensure webhook: %s", e)
 
     stop_event = asyncio.Event()
     loop = asyncio.get_running_loop()
@@ -153,7 +207,7 @@ async def _run() -> None:
         :type signum: int
         :return: None
         """
-        logger.info(f"Received signal {signum}, shutting down")
+        logger.info("Received signal %s, shutting down", signum)
         stop_event.set()
 
     for sig in (signal.SIGTERM, signal.SIGINT):
@@ -162,9 +216,11 @@ async def _run() -> None:
     try:
         await stop_event.wait()
     finally:
+        sweep_task.cancel()
         logger.info(
-            f"Shutdown: draining connections "
-            f"(deadline {config.shutdown_timeout_seconds}s)"
+            "Shutdown: draining connections "
+            "(deadline %ss)",
+            config.shutdown_timeout_seconds,
         )
         try:
             await asyncio.wait_for(
@@ -174,6 +230,12 @@ async def _run() -> None:
         except asyncio.TimeoutError:
             logger.warning("Shutdown: drain deadline exceeded, forcing stop")
         finally:
+            # Remove any download directories still queued for deletion; the
+            # periodic sweep would catch them on the next start anyway, but
+            # tmpfs space is better reclaimed now.
+            await flush_pending_cleanup()
+            # Buffered stats rows, on the other hand, would be lost for good.
+            await stats_tracker.aclose()
             await bot.session.close()
             logger.info("Bot stopped")
 
@@ -184,7 +246,10 @@ def main() -> None:
     :return: None
     """
     try:
-        asyncio.run(_run())
+        if uvloop is not None:
+            asyncio.run(_run(), loop_factory=uvloop.new_event_loop)
+        else:
+            asyncio.run(_run())
     except KeyboardInterrupt:
         # asyncio.run may re-raise KeyboardInterrupt if it arrives before the
         # signal handler is installed. Treat that as a normal exit.
@@ -31,7 +31,7 @@ def _get_required(name: str) -> str:
     """
     value = os.environ.get(name, "").strip()
     if value == "":
-        logger.error(f"Required environment variable {name} is not set")
+        logger.error("Required environment variable %s is not set", name)
         sys.exit(1)
     return value
 
@@ -74,8 +74,11 @@ class Config:
         self.proxy_url: Optional[str] = (
             _get_optional(name="PROXY_URL", default="") or None
         )
-        self.admin_user_id: Optional[str] = (
-            _get_optional(name="ADMIN_USER_ID", default="") or None
+        # Parsed once so the per-message admin check in /stats is a plain
+        # integer comparison against message.from_user.id.
+        admin_user_id = _get_optional(name="ADMIN_USER_ID", default="")
+        self.admin_user_id: Optional[int] = (
+            int(admin_user_id) if admin_user_id != "" else None
         )
 
         self.google_credentials_json_base64: Optional[str] = (
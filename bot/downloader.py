@@ -6,11 +6,18 @@ report them to the user.
 """
 
 import asyncio
+import json
 import logging
-import uuid
+import os
+import random
+import re
+import shutil
+import time
+from collections import deque
 from pathlib import Path
 from typing import Optional
 
+import aiofiles
 import aiofiles.os
 from aiogram import Bot
 from aiogram.enums import ChatType
@@ -19,31 +26,174 @@ from aiogram.types import ChatMemberAdministrator, Message
 
 logger = logging.getLogger(__name__)
 
+# Cap on simultaneously running yt-dlp processes. Each one forks, holds an
+# outbound HTTP connection and buffers to disk, so a burst of links in a big
+# group must not translate into an unbounded process storm. Read from the
+# environment directly (not Config) because the cap is shared process-wide
+# and the semaphore must exist at module scope.
+_MAX_CONCURRENT_DOWNLOADS = int(os.environ.get("MAX_CONCURRENT_DOWNLOADS", "4"))
+_download_semaphore = asyncio.Semaphore(_MAX_CONCURRENT_DOWNLOADS)
+
+# How many trailing stderr lines to keep from a failed yt-dlp run. Error
+# classification only looks at the end of the trace.
+_STDERR_TAIL_LINES = 20
+
+# Resolved once at import so every spawn skips the $PATH walk. Falls back to
+# the bare name (and the exec-time PATH lookup) if resolution fails here.
+_YT_DLP = shutil.which("yt-dlp") or "yt-dlp"
+_FFPROBE = shutil.which("ffprobe") or "ffprobe"
+
+# Constant part of the yt-dlp argv; only --limit-rate, --output, the optional
+# proxy and the URL vary per attempt, so the prefix is built once at import.
+_YTDLP_BASE_ARGS = (
+    _YT_DLP,
+    "--quiet",
+    "--no-warnings",
+    # Prefer a format that already fits Telegram's 50 MB limit (exact size
+    # first, then approximate — many IG/TikTok formats only declare
+    # filesize_approx) so a smaller rendition (e.g. 720p) is chosen over the
+    # best one when the best one wouldn't fit. Falls back to plain "best"
+    # when no format declares a size at all; --max-filesize below still
+    # guards that case.
+    "--format",
+    "best[filesize<=50M]/best[filesize_approx<=50M]/best",
+    # Mirrors the Telegram Bot API's 50 MB upload limit so yt-dlp refuses to
+    # download a file we couldn't send anyway, protecting the tmpfs-backed
+    # temp_dir from oversized files.
+    "--max-filesize",
+    "50M",
+    # Written before the media download, so a leftover .info.json with no
+    # video file is our only signal that yt-dlp aborted on --max-filesize
+    # (the file_too_large branch in download_video relies on it).
+    "--write-info-json",
+    # Print the final file path plus the dimensions yt-dlp already knows to
+    # stdout in one tab-separated line, instead of scanning the download
+    # directory and probing the file with ffprobe afterwards. --print
+    # implies --simulate, so --no-simulate restores the actual download.
+    "--no-simulate",
+    "--print",
+    "after_move:%(filepath)s\t%(width)s\t%(height)s",
+    # Read-only rootfs: no writable cache directory is guaranteed.
+    "--no-cache-dir",
+)
+
+# Retry backoff parameters. Rate-limit errors back off from a higher base —
+# hammering a 429 with the same cadence just extends the ban — while ordinary
+# transient failures (DNS blips, connection resets) retry quickly.
+_RETRY_BASE_SECONDS = 0.5
+_RETRY_RATE_LIMIT_BASE_SECONDS = 2.0
+_RETRY_MAX_SECONDS = 30.0
+_RETRY_JITTER = 0.5
+
+
+def _retry_delay(attempt: int, rate_limited: bool) -> float:
+    """Compute the jittered exponential delay before retry ``attempt``.
+
+    Jitter spreads out retries so several downloads failing at the same
+    moment (e.g. a shared 429 from one extractor) don't all hit the site
+    again in lockstep.
+
+    :param attempt: Attempt index about to run (1-based for retries).
+    :type attempt: int
+    :param rate_limited: Whether the previous failure was a rate-limit error.
+    :type rate_limited: bool
+    :return: Delay in seconds.
+    :rtype: float
+    """
+    base = _RETRY_RATE_LIMIT_BASE_SECONDS if rate_limited else _RETRY_BASE_SECONDS
+    delay = min(_RETRY_MAX_SECONDS, base * 2 ** (attempt - 1))
+    return delay * (1 + random.random() * _RETRY_JITTER)
+
+
+# Error categories that are deterministic: retrying the exact same URL cannot
+# succeed, so the retry loop returns immediately instead of paying two more
+# subprocess spawns and network round-trips.
+_UNRECOVERABLE_CATEGORIES = frozenset(
+    {"private", "unavailable", "age_restricted", "login_required", "geo_restricted"}
+)
+
+# All classification markers compiled into one alternation so the stderr text
+# is scanned once instead of once per substring test. finditer can report
+# several categories from one trace (e.g. "login" and "private"); the
+# priority tuple below decides which one wins, matching the order of the old
+# if-cascade.
+_ERROR_CATEGORY_PATTERN = re.compile(
+    r"(?P<file_too_large>file_too_large)"
+    r"|(?P<private>private|приватн)"
+    r"|(?P<unavailable>not available|unavailable|empty media)"
+    r"|(?P<age_restricted>age[\s_-]*restrict)"
+    r"|(?P<rate_limited>429|rate[ -]limit|too many requests)"
+    r"|(?P<login_required>login|sign in)"
+    r"|(?P<geo_restricted>geo|region|country)"
+)
+_CATEGORY_PRIORITY = (
+    "file_too_large",
+    "private",
+    "unavailable",
+    "age_restricted",
+    "rate_limited",
+    "login_required",
+    "geo_restricted",
+)
+
+
+def classify_ytdlp_error(error_msg: Optional[str]) -> str:
+    """Classify a yt-dlp stderr string into a stable error category.
+
+    The categories drive three consumers: the retry loop here (rate-limit
+    vs. unrecoverable vs. transient), the user-facing message in the
+    handlers, and the stats label — so the free-form stderr is parsed
+    exactly once per failure.
+
+    :param error_msg: yt-dlp stderr text, the ``"file_too_large"`` marker,
+        or ``None``.
+    :type error_msg: Optional[str]
+    :return: One of ``"unknown"``, ``"file_too_large"``, ``"private"``,
+        ``"unavailable"``, ``"age_restricted"``, ``"rate_limited"``,
+        ``"login_required"``, ``"geo_restricted"`` or ``"other"``.
+    :rtype: str
+    """
+    if error_msg is None:
+        return "unknown"
+    found = {
+        m.lastgroup for m in _ERROR_CATEGORY_PATTERN.finditer(error_msg.lower())
+    }
+    for category in _CATEGORY_PRIORITY:
+        if category in found:
+            return category
+    return "other"
 
-def _is_ytdlp_artifact(path: Path) -> bool:
-    """Return True if ``path`` is a yt-dlp helper/partial artifact, not a
-    finished media file.
 
-    yt-dlp leaves ``.part`` / ``.ytdl`` files (and fragment partials such as
-    ``.part-Frag0``) on interrupted or fragmented downloads, plus the
-    ``.info.json`` metadata file. ``download_id`` is shared across retries, so
-    a stale partial must not be mistaken for a finished video nor mask the
-    ``file_too_large`` branch.
+async def get_video_dimensions(video_path: Path) -> tuple[int, int]:
+    """Extract video dimensions, preferring yt-dlp's info JSON over ffprobe.
 
-    :param path: Candidate file produced under ``temp_dir``.
-    :type path: Path
-    :return: ``True`` for yt-dlp artifacts, ``False`` for real media files.
-    :rtype: bool
+    yt-dlp already knows the dimensions of the format it downloaded and we
+    write its info JSON anyway, so the common case is an in-process file read
+    instead of an ffprobe subprocess spawn. ffprobe remains as a fallback for
+    formats where yt-dlp reports no dimensions.
+
+    :param video_path: Path to the video file.
+    :type video_path: Path
+    :return: Tuple of ``(width, height)``; ``(0, 0)`` when detection fails.
+    :rtype: tuple[int, int]
     """
-    suffix = path.suffix
-    return (
-        suffix == ".json"
-        or suffix.startswith(".part")
-        or suffix.startswith(".ytdl")
-    )
+    info_path = video_path.with_suffix(".info.json")
+    try:
+        async with aiofiles.open(info_path, encoding="utf-8") as f:
+            info = json.loads(await f.read())
+        width = info.get("width")
+        height = info.get("height")
+        if isinstance(width, int) and isinstance(height, int):
+            logger.info("Video dimensions (info JSON): %sx%s", width, height)
+            return width, height
+        logger.debug("Info JSON has no dimensions, falling back to ffprobe")
+    except Exception as e:
+        logger.warning("Could not read dimensions from %s: %s", info_path.name, e)
 
+    return await _ffprobe_video_dimensions(video_path=video_path)
 
-async def get_video_dimensions(video_path: Path) -> tuple[int, int]:
+
+async def _ffprobe_video_dimensions(video_path: Path) -> tuple[int, int]:
     """Extract video dimensions using ffprobe.
 
     :param video_path: Path to the video file.
@@ -53,7 +203,7 @@ async def get_video_dimensions(video_path: Path) -> tuple[int, int]:
     """
     try:
         cmd = [
-            "ffprobe",
+            _FFPROBE,
             "-v",
             "error",
             "-select_streams",
@@ -62,7 +212,7 @@ async def get_video_dimensions(video_path: Path) -> tuple[int, int]:
             "stream=width,height",
             "-of",
             "csv=s=x:p=0",
-            str(video_path),
+            os.fspath(video_path),
         ]
 
         process = await asyncio.create_subprocess_exec(
@@ -76,14 +226,14 @@ async def get_video_dimensions(video_path: Path) -> tuple[int, int]:
         if process.returncode == 0:
             output = stdout.decode().strip()
             width, height = map(int, output.split("x"))
-            logger.info(f"Video dimensions: {width}x{height}")
+            logger.info("Video dimensions: %sx%s", width, height)
             return width, height
         else:
             logger.warning("Could not extract video dimensions")
             return 0, 0
 
     except Exception as e:
-        logger.error(f"Error extracting video dimensions: {e}")
+        logger.error("Error extracting video dimensions: %s", e)
         return 0, 0
 
 
@@ -93,7 +243,7 @@ async def download_video(
     proxy_url: Optional[str] = None,
     use_proxy: bool = False,
     max_retries: int = 3,
-) -> tuple[Optional[Path], Optional[str]]:
+) -> tuple[Optional[Path], tuple[int, int], Optional[str]]:
     """Download a video from Instagram or TikTok using yt-dlp, with retries.
 
     Retries up to ``max_retries`` times; on HTTP 429/rate-limit errors the
@@ -111,19 +261,33 @@ async def download_video(
     :type use_proxy: bool
     :param max_retries: Maximum number of attempts.
     :type max_retries: int
-    :return: Tuple of ``(path_to_video, error_msg)``. On success the second
-        element is ``None``; on failure the first element is ``None``. When
-        the video exceeds ``--max-filesize`` (50M), yt-dlp aborts silently
-        with exit code 0 and no video file, and ``error_msg`` is the literal
-        marker ``"file_too_large"`` (not retried).
-    :rtype: tuple[Optional[Path], Optional[str]]
+    :return: Tuple of ``(path_to_video, (width, height), error_msg)``. On
+        success ``error_msg`` is ``None``; on failure the path is ``None``.
+        Dimensions come from yt-dlp's info dict and are ``(0, 0)`` when the
+        extractor doesn't report them — use :func:`get_video_dimensions` as
+        a fallback then. When the video exceeds ``--max-filesize`` (50M),
+        yt-dlp aborts silently with exit code 0 and no video file, and
+        ``error_msg`` is the literal marker ``"file_too_large"`` (not
+        retried). The returned video lives in a per-download subdirectory of
+        ``temp_dir``; pass it to :func:`cleanup_download_dir` once it has
+        been sent.
+    :rtype: tuple[Optional[Path], tuple[int, int], Optional[str]]
     """
     rate_limits = ["8M", "4M", "2M", "1M"]
 
     last_error_msg: Optional[str] = None
     current_rate_limit_index = 0
+    last_was_rate_limit = False
 
-    download_id = str(uuid.uuid4())[:8]
+    # Every download gets its own subdirectory, so concurrent jobs can never
+    # see each other's files and finding the result is O(1) instead of a
+    # glob + stat scan over the shared temp dir. os.urandom is all the
+    # uniqueness needed here — no UUID object or formatting in between.
+    download_dir = temp_dir / os.urandom(8).hex()
+    await aiofiles.os.makedirs(download_dir, exist_ok=True)
+
+    # Fixed for the whole call — no need to rebuild it per attempt.
+    output_template = os.fspath(download_dir / "%(id)s.%(ext)s")
 
     for attempt in range(max_retries):
         try:
@@ -132,41 +296,21 @@ async def download_video(
             ]
 
             if attempt > 0:
+                delay = _retry_delay(
+                    attempt=attempt, rate_limited=last_was_rate_limit
+                )
                 logger.info(
-                    f"Retry attempt {attempt + 1}/{max_retries} with rate-limit: {current_rate_limit}"
+                    "Retry attempt %s/%s in %.1fs with rate-limit: %s",
+                    attempt + 1, max_retries, delay, current_rate_limit,
                 )
-                await asyncio.sleep(2)
-
-            output_template = str(temp_dir / f"{download_id}_%(id)s.%(ext)s")
+                await asyncio.sleep(delay)
 
             cmd = [
-                "yt-dlp",
-                "--quiet",
-                "--no-warnings",
-                "--format",
-                # Prefer a format that already fits Telegram's 50 MB limit
-                # (exact size first, then approximate — many IG/TikTok
-                # formats only declare filesize_approx) so a smaller
-                # rendition (e.g. 720p) is chosen over the best one when the
-                # best one wouldn't fit. Falls back to plain "best" when no
-                # format declares a size at all; --max-filesize below still
-                # guards that case.
-                "best[filesize<=50M]/best[filesize_approx<=50M]/best",
-                # Mirrors the Telegram Bot API's 50 MB upload limit so yt-dlp
-                # refuses to download a file we couldn't send anyway,
-                # protecting the tmpfs-backed temp_dir from oversized files.
-                "--max-filesize",
-                "50M",
+                *_YTDLP_BASE_ARGS,
                 "--limit-rate",
                 current_rate_limit,
                 "--output",
                 output_template,
-                # Written before the media download, so a leftover .info.json
-                # with no video file is our only signal that yt-dlp aborted on
-                # --max-filesize (the file_too_large branch below relies on it).
-                "--write-info-json",
-                # Read-only rootfs: no writable cache directory is guaranteed.
-                "--no-cache-dir",
             ]
 
             if use_proxy and proxy_url is not None:
@@ -179,123 +323,262 @@ async def download_video(
             cmd.append(url)
 
             logger.info(
-                f"Starting yt-dlp (attempt {attempt + 1}/{max_retries}, "
-                f"rate-limit={current_rate_limit}): {url}"
+                "Starting yt-dlp (attempt %s/%s, "
+                "rate-limit=%s): %s",
+                attempt + 1, max_retries, current_rate_limit, url,
             )
 
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
+            async with _download_semaphore:
+                process = await asyncio.create_subprocess_exec(
+                    *cmd,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                )
 
-            stdout, stderr = await process.communicate()
+                # communicate() buffers both pipes fully in memory. stdout is
+                # just the --print line, but failure traces can be large and
+                # only the tail matters for error classification, so stderr is
+                # drained line-by-line into a bounded deque.
+                stdout_task = asyncio.create_task(process.stdout.read())
+                stderr_tail: deque[bytes] = deque(maxlen=_STDERR_TAIL_LINES)
+                async for line in process.stderr:
+                    stderr_tail.append(line)
+                stdout = await stdout_task
+                await process.wait()
             logger.info(
-                f"yt-dlp finished (attempt {attempt + 1}/{max_retries}), "
-                f"returncode={process.returncode}"
+                "yt-dlp finished (attempt %s/%s), "
+                "returncode=%s",
+                attempt + 1, max_retries, process.returncode,
             )
 
             if process.returncode != 0:
-                error_msg = stderr.decode().strip()
+                error_msg = b"".join(stderr_tail).decode(errors="replace").strip()
                 last_error_msg = error_msg
 
-                error_msg_lower = error_msg.lower()
-                is_rate_limit_error = (
-                    "429" in error_msg
-                    or "rate limit" in error_msg_lower
-                    or "rate-limit" in error_msg_lower
-                    or "too many requests" in error_msg_lower
-                )
+                category = classify_ytdlp_error(error_msg=error_msg)
+                last_was_rate_limit = category == "rate_limited"
 
-                if is_rate_limit_error:
+                if category == "rate_limited":
                     logger.warning(
-                        f"Rate-limit error detected (attempt {attempt + 1}/{max_retries}): "
-                        f"{error_msg}"
+                        "Rate-limit error detected (attempt %s/%s): "
+                        "%s",
+                        attempt + 1, max_retries, error_msg,
                     )
                     current_rate_limit_index += 1
                     if attempt < max_retries - 1:
                         continue
+                elif category in _UNRECOVERABLE_CATEGORIES:
+                    # Private/removed/login-walled/geo-blocked content stays
+                    # that way for the next 3 attempts too; don't retry.
+                    logger.warning(
+                        "Unrecoverable yt-dlp error (%s), not retrying: %s",
+                        category, error_msg,
+                    )
                 else:
                     logger.error(
-                        f"yt-dlp error (attempt {attempt + 1}/{max_retries}): {error_msg}"
+                        "yt-dlp error (attempt %s/%s): %s",
+                        attempt + 1, max_retries, error_msg,
                     )
                     if attempt < max_retries - 1:
                         continue
 
-                return None, error_msg
+                await _remove_download_dir(download_dir=download_dir)
+                return None, (0, 0), error_msg
 
-            all_files = list(temp_dir.glob(f"{download_id}_*"))
-            files = [p for p in all_files if not _is_ytdlp_artifact(path=p)]
-            if not files:
+            printed = stdout.decode().strip()
+            if not printed:
                 # yt-dlp aborts silently (exit code 0, --quiet swallows the
-                # "Aborting" message) when --max-filesize is exceeded. It
-                # still writes the info JSON before attempting the media
-                # download, so a leftover info.json with no video file is
-                # the only signal we have that this was a size rejection
+                # "Aborting" message) when --max-filesize is exceeded, and
+                # "after_move:filepath" prints nothing since no file was
+                # moved. It still writes the info JSON before attempting the
+                # media download, so a leftover info.json with no video file
+                # is the only signal we have that this was a size rejection
                 # rather than a real download failure. Retrying is useless
                 # here since the file won't get smaller.
-                info_jsons = [p for p in all_files if p.name.endswith(".info.json")]
-                if info_jsons:
+                # The only sync fs access left on the request path; tiny dir,
+                # but a slow disk must not stall every other coroutine.
+                has_info_json = await asyncio.to_thread(
+                    lambda: any(download_dir.glob("*.info.json"))
+                )
+                if has_info_json:
                     logger.warning(
-                        f"yt-dlp aborted: file exceeds --max-filesize "
-                        f"(attempt {attempt + 1}/{max_retries})"
+                        "yt-dlp aborted: file exceeds --max-filesize "
+                        "(attempt %s/%s)",
+                        attempt + 1, max_retries,
                     )
-                    for info_json in info_jsons:
-                        info_json.unlink(missing_ok=True)
-                    return None, "file_too_large"
+                    await _remove_download_dir(download_dir=download_dir)
+                    return None, (0, 0), "file_too_large"
 
                 error_msg = "No file was downloaded"
                 last_error_msg = error_msg
+                last_was_rate_limit = False
                 if attempt < max_retries - 1:
-                    logger.warning(f"{error_msg} (attempt {attempt + 1}/{max_retries})")
+                    logger.warning(
+                        "%s (attempt %s/%s)", error_msg, attempt + 1, max_retries
+                    )
                     continue
-                logger.error(f"{error_msg} - all retries exhausted")
-                return None, error_msg
-
-            video_file = max(files, key=lambda p: p.stat().st_mtime)
-            logger.info(f"Downloaded: {video_file.name} (attempt {attempt + 1})")
-            return video_file, None
+                logger.error("%s - all retries exhausted", error_msg)
+                await _remove_download_dir(download_dir=download_dir)
+                return None, (0, 0), error_msg
+
+            # One printed line per downloaded entry; a carousel post can
+            # yield several. Only the last entry is sent onwards, matching
+            # the single reply_video the handlers produce.
+            path_str, _, dims_str = printed.splitlines()[-1].partition("\t")
+            video_file = Path(path_str)
+            dimensions = _parse_printed_dimensions(line=dims_str)
+            logger.info("Downloaded: %s (attempt %s)", video_file.name, attempt + 1)
+            return video_file, dimensions, None
 
         except Exception as e:
             error_msg = str(e)
             last_error_msg = error_msg
+            last_was_rate_limit = False
             logger.error(
-                f"Download error (attempt {attempt + 1}/{max_retries}): {error_msg}"
+                "Download error (attempt %s/%s): %s",
+                attempt + 1, max_retries, error_msg,
             )
             if attempt < max_retries - 1:
                 continue
 
-    return None, last_error_msg or "Download failed after all retry attempts"
+    await _remove_download_dir(download_dir=download_dir)
+    return None, (0, 0), last_error_msg or "Download failed after all retry attempts"
+
+
+def _parse_printed_dimensions(line: str) -> tuple[int, int]:
+    """Parse the ``"%(width)s\\t%(height)s"`` part printed by yt-dlp.
+
+    :param line: Printed fields, e.g. ``"1080\\t1920"`` or ``"NA\\tNA"`` when
+        the extractor doesn't know the dimensions.
+    :type line: str
+    :return: Tuple of ``(width, height)``; ``(0, 0)`` when unknown.
+    :rtype: tuple[int, int]
+    """
+    try:
+        width_str, height_str = line.split()
+        return int(width_str), int(height_str)
+    except ValueError:
+        return 0, 0
+
 
+async def _remove_download_dir(download_dir: Path) -> None:
+    """Remove a per-download directory and everything in it.
 
-async def cleanup_file(file_path: Path) -> None:
-    """Delete a file asynchronously, logging errors instead of raising.
+    Best-effort: errors are logged, never raised. ``shutil.rmtree`` is
+    blocking, so it runs in a worker thread.
 
-    :param file_path: Path to the file to delete.
-    :type file_path: Path
+    :param download_dir: Per-download subdirectory of the temp dir.
+    :type download_dir: Path
     :return: None
     """
     try:
-        await aiofiles.os.remove(file_path)
-        logger.info(f"Cleaned up: {file_path.name}")
+        await asyncio.to_thread(shutil.rmtree, download_dir, True)
+        logger.info("Cleaned up: %s", download_dir.name)
     except Exception as e:
-        logger.error(f"Cleanup error: {e}")
+        logger.error("Cleanup error: %s", e)
+
+
+async def sweep_temp_dir(temp_dir: Path, max_age_seconds: float = 3600.0) -> None:
+    """Remove leftover download directories older than ``max_age_seconds``.
+
+    After a crash or SIGKILL, per-download directories can survive in the
+    temp dir and eat disk (tmpfs in production, so effectively RAM). Called
+    once at startup and then periodically; errors are logged, never raised.
+
+    :param temp_dir: Directory holding per-download subdirectories.
+    :type temp_dir: Path
+    :param max_age_seconds: Minimum age before an entry is considered stale.
+    :type max_age_seconds: float
+    :return: None
+    """
+
+    def _sweep() -> int:
+        cutoff = time.time() - max_age_seconds
+        removed = 0
+        for entry in temp_dir.iterdir():
+            try:
+                if entry.stat().st_mtime >= cutoff:
+                    continue
+                if entry.is_dir():
+                    shutil.rmtree(entry, ignore_errors=True)
+                else:
+                    entry.unlink(missing_ok=True)
+                removed += 1
+            except OSError:
+                # A concurrent download may remove its own directory while we
+                # iterate; nothing to do.
+                continue
+        return removed
+
+    try:
+        removed = await asyncio.to_thread(_sweep)
+        if removed > 0:
+            logger.info("Swept %s stale entries from %s", removed, temp_dir)
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.error("Temp dir sweep failed: %s", e)
+
 
+# Per-download directories awaiting deletion. Removals are batched by one
+# lazily started worker, so each sent video costs a queue append on the hot
+# path instead of its own thread-pool hop.
+_CLEANUP_INTERVAL_SECONDS = 5.0
+_cleanup_queue: "asyncio.Queue[Path]" = asyncio.Queue()
+_cleanup_worker_task: Optional["asyncio.Task[None]"] = None
 
-async def cleanup_info_json(video_path: Path) -> None:
-    """Delete the yt-dlp info JSON file associated with a video.
+
+def cleanup_download_dir(video_path: Path) -> None:
+    """Schedule a downloaded video's per-download directory for deletion.
+
+    The whole subdirectory :func:`download_video` created (video, yt-dlp
+    info JSON, partial artifacts) is queued and removed by a background
+    worker in batches. Queuing never blocks; the worker starts lazily on
+    first use.
 
     :param video_path: Path to the downloaded video file.
     :type video_path: Path
     :return: None
     """
-    info_path = video_path.with_suffix(".info.json")
+    global _cleanup_worker_task
+    _cleanup_queue.put_nowait(video_path.parent)
+    if _cleanup_worker_task is None or _cleanup_worker_task.done():
+        _cleanup_worker_task = asyncio.create_task(_cleanup_worker())
+
+
+async def _cleanup_worker() -> None:
+    """Drain the cleanup queue once per interval, forever.
+
+    :return: None
+    """
+    while True:
+        await asyncio.sleep(_CLEANUP_INTERVAL_SECONDS)
+        await flush_pending_cleanup()
+
+
+async def flush_pending_cleanup() -> None:
+    """Remove every queued per-download directory in one worker-thread hop.
+
+    Called periodically by the cleanup worker and once during shutdown so
+    nothing queued is left behind.
+
+    :return: None
+    """
+    batch: list[Path] = []
+    while not _cleanup_queue.empty():
+        batch.append(_cleanup_queue.get_nowait())
+    if not batch:
+        return
+
+    def _remove_batch() -> None:
+        for directory in batch:
+            shutil.rmtree(directory, ignore_errors=True)
+
     try:
-        if await aiofiles.os.path.exists(info_path):
-            await aiofiles.os.remove(info_path)
-            logger.debug(f"Cleaned up info JSON: {info_path.name}")
+        await asyncio.to_thread(_remove_batch)
+        logger.info("Cleaned up %s download directories", len(batch))
     except Exception as e:
-        logger.warning(f"Could not clean up info JSON {info_path.name}: {e}")
+        logger.error("Batch cleanup error: %s", e)
 
 
 async def can_bot_delete_messages(message: Message, bot: Bot) -> bool:
@@ -320,6 +603,7 @@ async def can_bot_delete_messages(message: Message, bot: Bot) -> bool:
         return False
     except (TelegramBadRequest, TelegramForbiddenError) as e:
         logger.warning(
-            f"Could not check bot permissions in chat {message.chat.id}: {e}"
+            "Could not check bot permissions in chat %s: %s",
+            message.chat.id, e,
         )
         return False
@@ -9,19 +9,22 @@ and ``stats_tracker`` in :mod:`bot.__main__`.
 import asyncio
 import logging
 import re
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional
+from typing import Any, Coroutine, Optional, Union
 
+import aiofiles
+import aiofiles.os
 from aiogram import Bot, F, Router
 from aiogram.exceptions import TelegramBadRequest, TelegramForbiddenError
 from aiogram.filters import Command
-from aiogram.types import FSInputFile, Message
+from aiogram.types import BufferedInputFile, FSInputFile, InputFile, Message
 
 from bot.config import Config
 from bot.downloader import (
     can_bot_delete_messages,
-    cleanup_file,
-    cleanup_info_json,
+    classify_ytdlp_error,
+    cleanup_download_dir,
     download_video,
     get_video_dimensions,
 )
@@ -32,15 +35,147 @@ logger = logging.getLogger(__name__)
 router = Router(name="instasaver")
 
 
-INSTAGRAM_REELS_PATTERN = re.compile(
-    r"https?://(?:www\.)?instagram\.com/(reel|p|tv)/[\w-]+/?",
+# Single alternation so every inbound message is scanned by the regex engine
+# once; the named group that captured tells us which platform matched.
+# The character classes use bounded possessive quantifiers (no real URL path
+# comes close to the limits) so pathological near-matching input from
+# untrusted group messages cannot trigger backtracking blow-ups.
+URL_PATTERN = re.compile(
+    r"(?P<instagram>https?://(?:www\.)?instagram\.com/(?:reel|p|tv)/[\w-]{1,128}+/?)"
+    r"|(?P<tiktok>https?://(?:www\.|vm\.|vt\.)?tiktok\.com/[@\w\-/.?=&]{1,512}+)",
     re.IGNORECASE,
 )
 
-TIKTOK_PATTERN = re.compile(
-    r"https?://(?:www\.|vm\.|vt\.)?tiktok\.com/[@\w\-/.?=&]+",
-    re.IGNORECASE,
-)
+# Static dispatch from the named group that matched to the platform label and
+# whether the download should route through the proxy (TikTok only — Instagram
+# works directly via yt-dlp's browser impersonation).
+_PLATFORM_BY_GROUP: dict[str, tuple[str, bool]] = {
+    "instagram": ("Instagram", False),
+    "tiktok": ("TikTok", True),
+}
+
+# Viral URLs get re-posted many times in a short window. The first request
+# downloads and uploads; concurrent duplicates await its future, and later
+# duplicates are served straight from Telegram's servers via the cached
+# file_id — no yt-dlp run, no re-upload.
+_inflight_downloads: dict[str, "asyncio.Future[Optional[str]]"] = {}
+
+# Videos up to this size are read into memory and uploaded in one buffer
+# instead of letting aiogram re-open and stream the file in small chunks.
+# Anything bigger falls back to FSInputFile to keep RSS bounded.
+_MAX_IN_MEMORY_VIDEO_BYTES = 25 * 1024 * 1024
+
+# Telegram messages go up to 4096 chars; any real video URL starts well
+# within this prefix, so bounding the scan caps worst-case regex work on
+# spam-sized messages.
+_MAX_SCAN_LENGTH = 2048
+
+_FILE_ID_CACHE_SIZE = 128
+_recent_file_ids: "OrderedDict[str, str]" = OrderedDict()
+
+# The event loop only keeps weak references to tasks, so a bare
+# create_task() result can be garbage-collected before it runs. Background
+# work (stats writes, temp cleanup) parks here until done.
+_background_tasks: set["asyncio.Task[None]"] = set()
+
+
+def _spawn(coro: "Coroutine[Any, Any, None]") -> None:
+    """Run ``coro`` as a fire-and-forget task that cannot be GC'd early.
+
+    :param coro: Coroutine to schedule.
+    :type coro: Coroutine
+    :return: None
+    """
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+def _find_video_url(message: Message) -> Optional[tuple[str, str, bool]]:
+    """Extract the first supported video URL from a message.
+
+    Telegram's servers already mark ``url`` and ``text_link`` entities with
+    offsets, so when entities are present only those short candidates are
+    matched against the pattern — no scan of the full text, and hidden
+    ``text_link`` URLs are caught too. The regex scan of the message text is
+    the fallback for clients that sent no entities.
+
+    :param message: Incoming message with ``text`` set.
+    :type message: Message
+    :return: Tuple of ``(url, platform, use_proxy)``, or ``None`` when no
+        supported URL is present.
+    :rtype: Optional[tuple[str, str, bool]]
+    """
+    # One attribute fetch; aiogram model access goes through pydantic's
+    # descriptor machinery and this runs for every inbound group message.
+    text = message.text
+
+    if message.entities:
+        for entity in message.entities:
+            if entity.type == "url":
+                # extract_from handles Telegram's UTF-16 entity offsets.
+                candidate = entity.extract_from(text)
+            elif entity.type == "text_link" and entity.url is not None:
+                candidate = entity.url
+            else:
+                continue
+            match = URL_PATTERN.search(candidate)
+            if match is not None:
+                return _matched_url(match=match)
+        return None
+
+    text = text[:_MAX_SCAN_LENGTH]
+
+    # Cheap C-level substring check before the regex: most group traffic
+    # carries no URL at all, and both supported patterns require "http".
+    if "http" not in text:
+        return None
+
+    match = URL_PATTERN.search(text)
+    if match is None:
+        return None
+    return _matched_url(match=match)
+
+
+def _matched_url(match: "re.Match[str]") -> tuple[str, str, bool]:
+    """Map a :data:`URL_PATTERN` match to ``(url, platform, use_proxy)``.
+
+    :param match: Successful match of :data:`URL_PATTERN`.
+    :type match: re.Match[str]
+    :return: Tuple of ``(url, platform, use_proxy)``.
+    :rtype: tuple[str, str, bool]
+    """
+    platform, use_proxy = _PLATFORM_BY_GROUP[match.lastgroup]
+    return match.group(0), platform, use_proxy
+
+
+def _cached_file_id(url: str) -> Optional[str]:
+    """Look up a recently uploaded Telegram ``file_id`` for ``url``.
+
+    :param url: Canonical video URL extracted from the message.
+    :type url: str
+    :return: Cached ``file_id``, or ``None`` on a miss.
+    :rtype: Optional[str]
+    """
+    file_id = _recent_file_ids.get(url)
+    if file_id is not None:
+        _recent_file_ids.move_to_end(url)
+    return file_id
+
+
+def _cache_file_id(url: str, file_id: str) -> None:
+    """Remember the Telegram ``file_id`` of an uploaded video, LRU-bounded.
+
+    :param url: Canonical video URL the upload originated from.
+    :type url: str
+    :param file_id: Telegram ``file_id`` of the uploaded video.
+    :type file_id: str
+    :return: None
+    """
+    _recent_file_ids[url] = file_id
+    _recent_file_ids.move_to_end(url)
+    while len(_recent_file_ids) > _FILE_ID_CACHE_SIZE:
+        _recent_file_ids.popitem(last=False)
 
 
 @router.message(Command("start"))
@@ -86,8 +221,7 @@ async def cmd_help(message: Message) -> None:
         "• tiktok.com/@username/video/...\n"
         "• vm.tiktok.com/...\n"
         "• vt.tiktok.com/...\n\n"
-        "<b>Примечание:</b> Работает только с публичным контентом.",
-        parse_mode="HTML",
+        "<b>Примечание:</b> Работает только с публичным контентом."
     )
 
 
@@ -114,14 +248,15 @@ async def cmd_stats(
         return
 
     admin_id = config.admin_user_id
-    if admin_id is None or str(message.from_user.id) != admin_id:
+    if admin_id is None or message.from_user.id != admin_id:
         logger.debug(
-            f"Stats request from non-admin user {message.from_user.id}, ignoring. "
-            f"Admin ID: {admin_id}"
+            "Stats request from non-admin user %s, ignoring. "
+            "Admin ID: %s",
+            message.from_user.id, admin_id,
         )
         return
 
-    logger.info(f"Stats request from admin user {message.from_user.id}")
+    logger.info("Stats request from admin user %s", message.from_user.id)
 
     status_msg = await message.answer("📊 Получаю статистику...")
 
@@ -131,12 +266,13 @@ async def cmd_stats(
 
         if stats_data is not None:
             logger.info(
-                f"Stats retrieved successfully: {stats_data['total']} total records, "
-                f"{stats_data['success']} successful"
+                "Stats retrieved successfully: %s total records, "
+                "%s successful",
+                stats_data['total'], stats_data['success'],
             )
             formatted_message = stats_tracker.format_stats_message(stats=stats_data)
-            await status_msg.edit_text(text=formatted_message, parse_mode="HTML")
-            logger.info(f"Stats sent to admin {message.from_user.id}")
+            await status_msg.edit_text(text=formatted_message)
+            logger.info("Stats sent to admin %s", message.from_user.id)
         else:
             logger.warning("Stats data is None, Google Sheets may not be configured")
             await status_msg.edit_text(
@@ -147,8 +283,8 @@ async def cmd_stats(
             )
 
     except Exception as e:
-        logger.error(f"Error getting stats: {e}")
-        logger.debug(f"Exception type: {type(e).__name__}")
+        logger.error("Error getting stats: %s", e)
+        logger.debug("Exception type: %s", type(e).__name__)
         await status_msg.edit_text(text="❌ Произошла ошибка при получении статистики.")
 
 
@@ -176,114 +312,148 @@ async def handle_message(
     :type stats_tracker: GoogleSheetsStats
     :return: None
     """
-    if message.text is None:
-        return
-    if message.from_user is None:
+    if message.text is None or message.from_user is None:
         return
 
-    instagram_match = INSTAGRAM_REELS_PATTERN.search(message.text)
-    tiktok_match = TIKTOK_PATTERN.search(message.text)
-
-    video_url: str
-    platform: str
-    if instagram_match is not None:
-        video_url = instagram_match.group(0)
-        platform = "Instagram"
-    elif tiktok_match is not None:
-        video_url = tiktok_match.group(0)
-        platform = "TikTok"
-    else:
+    found = _find_video_url(message=message)
+    if found is None:
         return
+    video_url, platform, use_proxy = found
 
-    logger.info(f"Detected {platform} URL: {video_url}")
+    logger.info("Detected %s URL: %s", platform, video_url)
 
     logger.debug(
-        f"Checking bot delete permissions in chat {message.chat.id} "
-        f"(type={message.chat.type})"
+        "Checking bot delete permissions in chat %s "
+        "(type=%s)",
+        message.chat.id, message.chat.type,
     )
     bot_can_delete = await can_bot_delete_messages(message=message, bot=bot)
-    logger.debug(f"bot_can_delete={bot_can_delete}")
+    logger.debug("bot_can_delete=%s", bot_can_delete)
+
+    # The caption is a mention of the user who triggered the download, so
+    # the author stays visible even after the original message is deleted.
+    # Falls back to no caption when the user has no public @username.
+    username = message.from_user.username
+    caption = f"@{username}" if username is not None else None
+
+    # Served this URL recently? Telegram re-sends the stored upload by
+    # file_id — no download, no upload, no status bubble needed.
+    file_id = _cached_file_id(url=video_url)
+    if file_id is None:
+        inflight = _inflight_downloads.get(video_url)
+        if inflight is not None:
+            logger.info(
+                "Duplicate request for %s, awaiting in-flight download", video_url
+            )
+            file_id = await inflight
+
+    if file_id is not None:
+        await _send_video(
+            message=message,
+            video=file_id,
+            caption=caption,
+            bot_can_delete=bot_can_delete,
+        )
+        _spawn(
+            stats_tracker.log_download_success(
+                user_id=message.from_user.id,
+                chat_id=message.chat.id,
+                platform=platform,
+                url=video_url,
+            )
+        )
+        return
 
-    status_message = await message.reply(text="⏳ Скачиваю видео...")
+    download_future: "asyncio.Future[Optional[str]]" = (
+        asyncio.get_running_loop().create_future()
+    )
+    _inflight_downloads[video_url] = download_future
+
+    # Post the status bubble as a task so its Telegram round-trip overlaps
+    # with yt-dlp's first network requests; it's only awaited once something
+    # needs to edit or delete it.
+    status_task = asyncio.create_task(message.reply(text="⏳ Скачиваю видео..."))
 
     video_path: Optional[Path] = None
     try:
         # Both platforms use yt-dlp. Instagram downloads without cookies via
         # yt-dlp's browser impersonation (curl_cffi) and needs no proxy;
         # TikTok routes through the configured proxy.
-        use_proxy = platform == "TikTok"
-        video_path, yt_dlp_error = await download_video(
+        video_path, (width, height), yt_dlp_error = await download_video(
             url=video_url,
             temp_dir=config.temp_dir,
             proxy_url=config.proxy_url,
             use_proxy=use_proxy,
         )
-        error_detail = _ytdlp_error_detail(error_msg=yt_dlp_error)
-        # Keep the raw yt-dlp stderr for stats only; don't show it to users.
-        error_code = yt_dlp_error
-
+        status_message = await status_task
         if video_path is None:
+            # One classification pass covers the user-facing message and the
+            # stats label. Raw yt-dlp stderr goes to the log only — it may
+            # contain proxy URLs or full video IDs.
+            error_category = classify_ytdlp_error(error_msg=yt_dlp_error)
             logger.error(
-                f"Failed to download video from {platform}. "
-                f"URL: {video_url}. Error: {error_code}"
+                "Failed to download video from %s. "
+                "URL: %s. Error: %s",
+                platform, video_url, yt_dlp_error,
             )
-            error_text = (
-                error_detail
-                if error_detail is not None
-                else ("❌ Не удалось скачать видео.")
+            await status_message.edit_text(
+                text=_ERROR_MESSAGES.get(error_category, _GENERIC_ERROR_TEXT)
             )
-            await status_message.edit_text(text=error_text)
 
-            asyncio.create_task(
+            _spawn(
                 stats_tracker.log_download_error(
                     user_id=message.from_user.id,
                     chat_id=message.chat.id,
                     platform=platform,
                     url=video_url,
-                    error_msg=_safe_stats_error(error_code=error_code),
+                    error_msg=error_category,
                 )
             )
             return
 
+        video_size = (await aiofiles.os.stat(video_path)).st_size
         logger.info(
-            f"Video downloaded: {video_path.name} ({video_path.stat().st_size // 1024} KB)"
+            "Video downloaded: %s (%s KB)",
+            video_path.name, video_size // 1024,
         )
 
-        # The caption is a mention of the user who triggered the download, so
-        # the author stays visible even after the original message is deleted.
-        # Falls back to no caption when the user has no public @username.
-        username = message.from_user.username
-        caption = f"@{username}" if username is not None else None
-
-        width, height = await get_video_dimensions(video_path=video_path)
-        logger.debug(f"Video dimensions: {width}x{height}")
-
-        video_file = FSInputFile(path=video_path)
-
-        if bot_can_delete:
-            await message.answer_video(
-                video=video_file,
-                width=width if width > 0 else None,
-                height=height if height > 0 else None,
-                caption=caption,
-            )
+        if width > 0 and height > 0:
             await status_message.delete()
-            try:
-                await message.delete()
-            except (TelegramBadRequest, TelegramForbiddenError) as e:
-                logger.warning(
-                    f"Could not delete original message {message.message_id}: {e}"
+        else:
+            # yt-dlp didn't report dimensions for this format; probe the file
+            # while the status bubble is deleted — the two are independent of
+            # each other and of the upload that follows.
+            async with asyncio.TaskGroup() as tg:
+                dimensions_task = tg.create_task(
+                    get_video_dimensions(video_path=video_path)
+                )
+                tg.create_task(status_message.delete())
+            width, height = dimensions_task.result()
+        logger.debug("Video dimensions: %sx%s", width, height)
+
+        video_input: InputFile
+        if video_size < _MAX_IN_MEMORY_VIDEO_BYTES:
+            async with aiofiles.open(video_path, "rb") as f:
+                video_input = BufferedInputFile(
+                    file=await f.read(), filename=video_path.name
                 )
         else:
-            await message.reply_video(
-                video=video_file,
-                width=width if width > 0 else None,
-                height=height if height > 0 else None,
-                caption=caption,
-            )
-            await status_message.delete()
+            video_input = FSInputFile(path=video_path)
+
+        sent_message = await _send_video(
+            message=message,
+            video=video_input,
+            caption=caption,
+            bot_can_delete=bot_can_delete,
+            width=width if width > 0 else None,
+            height=height if height > 0 else None,
+        )
+
+        if sent_message.video is not None:
+            _cache_file_id(url=video_url, file_id=sent_message.video.file_id)
+            download_future.set_result(sent_message.video.file_id)
 
-        asyncio.create_task(
+        _spawn(
             stats_tracker.log_download_success(
                 user_id=message.from_user.id,
                 chat_id=message.chat.id,
@@ -292,87 +462,96 @@ async def handle_message(
             )
         )
 
-        await cleanup_info_json(video_path=video_path)
-        await cleanup_file(file_path=video_path)
+        # Queued for batched removal: the user already has their video, no
+        # need to wait for the rmtree.
+        cleanup_download_dir(video_path=video_path)
 
     except Exception as e:
-        logger.error(f"Error handling message: {e}")
-        await status_message.edit_text(
-            text="❌ Произошла ошибка при обработке запроса."
-        )
+        logger.error("Error handling message: %s", e)
+        error_text = "❌ Произошла ошибка при обработке запроса."
+        try:
+            # The bubble may not have been awaited yet (download failed
+            # early), may have failed to post at all, or may already be
+            # deleted if the failure happened mid-upload; fall back to a
+            # fresh reply in all those cases.
+            status_message = await status_task
+            await status_message.edit_text(text=error_text)
+        except Exception:
+            await message.reply(text=error_text)
         if video_path is not None:
-            await cleanup_info_json(video_path=video_path)
-            await cleanup_file(file_path=video_path)
+            cleanup_download_dir(video_path=video_path)
 
+    finally:
+        # Wake up any duplicate requests waiting on this URL. A None result
+        # means no file_id was produced; waiters fall back to their own
+        # download attempt.
+        if not download_future.done():
+            download_future.set_result(None)
+        _inflight_downloads.pop(video_url, None)
 
-def _ytdlp_error_detail(error_msg: Optional[str]) -> Optional[str]:
-    """Classify a yt-dlp stderr string into a user-facing message.
 
-    Used for both Instagram and TikTok, since both platforms download through
-    yt-dlp. yt-dlp returns free-form stderr; we only pattern-match on enough
-    markers to give the user a meaningful hint, and fall through to a generic
-    message otherwise. Raw stderr is **never** shown to the user — it may
-    contain proxy URLs or full video IDs.
-
-    :param error_msg: yt-dlp stderr text, or ``None``.
-    :return: User-facing message, or ``None`` when nothing's available.
-    """
-    if error_msg is None:
-        return "❌ Не удалось скачать видео.\n\n❓ Возможно, контент недоступен или является приватным."
-
-    lower = error_msg.lower()
-    if "file_too_large" in lower:
-        return "❌ Не удалось скачать видео.\n\n📦 Видео слишком большое для Telegram (>50 МБ)."
-    if "private" in lower or "приватн" in lower:
-        return "❌ Не удалось скачать видео.\n\n🔒 Видео является приватным и недоступно для скачивания."
-    if "not available" in lower or "unavailable" in lower or "empty media" in lower:
-        return "❌ Не удалось скачать видео.\n\n🚫 Видео недоступно. Возможно, оно было удалено или скрыто автором."
-    if "age" in lower and "restrict" in lower:
-        return "❌ Не удалось скачать видео.\n\n🔞 Видео имеет возрастные ограничения и требует входа в аккаунт."
-    if (
-        "429" in error_msg
-        or "rate limit" in lower
-        or "rate-limit" in lower
-        or "too many requests" in lower
-    ):
-        return "❌ Не удалось скачать видео.\n\n⏱️ Слишком много запросов. Пожалуйста, попробуйте позже."
-    if "login" in lower or "sign in" in lower:
-        return "❌ Не удалось скачать видео.\n\n🔑 Для скачивания этого видео требуется авторизация в аккаунте."
-    if "geo" in lower or "region" in lower or "country" in lower:
-        return "❌ Не удалось скачать видео.\n\n🌍 Видео недоступно в вашем регионе из-за географических ограничений."
-    return "❌ Не удалось скачать видео.\n\n⚠️ Технический сбой, попробуйте позже."
-
-
-def _safe_stats_error(error_code: Optional[str]) -> str:
-    """Return a stats-safe error label.
-
-    yt-dlp stderr is free-form and may contain proxy URLs or video IDs, so it
-    must never be stored verbatim in stats. We collapse it into a small set of
-    stable buckets derived from the same markers as :func:`_ytdlp_error_detail`.
-
-    :param error_code: yt-dlp stderr string, or ``None``.
-    :return: A stable, non-sensitive error label.
+async def _send_video(
+    message: Message,
+    video: Union[InputFile, str],
+    caption: Optional[str],
+    bot_can_delete: bool,
+    width: Optional[int] = None,
+    height: Optional[int] = None,
+) -> Message:
+    """Send a video to the chat, deleting the original message when allowed.
+
+    :param message: Message that triggered the download.
+    :type message: Message
+    :param video: Freshly downloaded file or a cached Telegram ``file_id``.
+    :type video: Union[InputFile, str]
+    :param caption: Caption mentioning the requesting user, or ``None``.
+    :type caption: Optional[str]
+    :param bot_can_delete: Whether the bot may delete the original message.
+    :type bot_can_delete: bool
+    :param width: Video width, or ``None`` to let Telegram detect it.
+    :type width: Optional[int]
+    :param height: Video height, or ``None`` to let Telegram detect it.
+    :type height: Optional[int]
+    :return: The sent video message.
+    :rtype: Message
     """
-    if error_code is None:
-        return "unknown"
-    lower = error_code.lower()
-    if "file_too_large" in lower:
-        return "file_too_large"
-    if "private" in lower or "приватн" in lower:
-        return "private"
-    if "not available" in lower or "unavailable" in lower or "empty media" in lower:
-        return "unavailable"
-    if "age" in lower and "restrict" in lower:
-        return "age_restricted"
-    if (
-        "429" in error_code
-        or "rate limit" in lower
-        or "rate-limit" in lower
-        or "too many requests" in lower
-    ):
-        return "rate_limited"
-    if "login" in lower or "sign in" in lower:
-        return "login_required"
-    if "geo" in lower or "region" in lower or "country" in lower:
-        return "geo_restricted"
-    return "other"
+    if bot_can_delete:
+        sent_message = await message.answer_video(
+            video=video,
+            width=width,
+            height=height,
+            caption=caption,
+        )
+        try:
+            await message.delete()
+        except (TelegramBadRequest, TelegramForbiddenError) as e:
+            logger.warning(
+                "Could not delete original message %s: %s",
+                message.message_id, e,
+            )
+    else:
+        sent_message = await message.reply_video(
+            video=video,
+            width=width,
+            height=height,
+            caption=caption,
+        )
+    return sent_message
+
+
+# User-facing messages per :func:`bot.downloader.classify_ytdlp_error`
+# category. The category doubles as the stats label, so yt-dlp's free-form
+# stderr is parsed exactly once per failure and never shown to users or
+# stored verbatim — it may contain proxy URLs or full video IDs.
+_GENERIC_ERROR_TEXT = "❌ Не удалось скачать видео.\n\n⚠️ Технический сбой, попробуйте позже."
+_ERROR_MESSAGES: dict[str, str] = {
+    "unknown": "❌ Не удалось скачать видео.\n\n❓ Возможно, контент недоступен или является приватным.",
+    "file_too_large": "❌ Не удалось скачать видео.\n\n📦 Видео слишком большое для Telegram (>50 МБ).",
+    "private": "❌ Не удалось скачать видео.\n\n🔒 Видео является приватным и недоступно для скачивания.",
+    "unavailable": "❌ Не удалось скачать видео.\n\n🚫 Видео недоступно. Возможно, оно было удалено или скрыто автором.",
+    "age_restricted": "❌ Не удалось скачать видео.\n\n🔞 Видео имеет возрастные ограничения и требует входа в аккаунт.",
+    "rate_limited": "❌ Не удалось скачать видео.\n\n⏱️ Слишком много запросов. Пожалуйста, попробуйте позже.",
+    "login_required": "❌ Не удалось скачать видео.\n\n🔑 Для скачивания этого видео требуется авторизация в аккаунте.",
+    "geo_restricted": "❌ Не удалось скачать видео.\n\n🌍 Видео недоступно в вашем регионе из-за географических ограничений.",
+    "other": _GENERIC_ERROR_TEXT,
+}
@@ -10,14 +10,77 @@ import json
 import logging
 import os
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from datetime import datetime, timedelta
 from typing import Optional
 
 import gspread
+from google.auth.transport.requests import AuthorizedSession
 from google.oauth2.service_account import Credentials
+from requests.adapters import HTTPAdapter, Retry
 
 logger = logging.getLogger(__name__)
 
+# How long buffered event rows may wait before being appended to the sheet,
+# and how many rows a batch may coalesce before it is flushed early. One
+# append_rows call per batch instead of one append_row per event keeps bursty
+# download traffic well under the Sheets per-minute write quota.
+_FLUSH_INTERVAL_SECONDS = 10.0
+_FLUSH_MAX_ROWS = 50
+
+# Upper bound on rows kept waiting for a retry after quota errors; beyond
+# this, batches are dropped rather than growing the queue without limit.
+_REQUEUE_LIMIT_ROWS = 1000
+
+# Column layout of the events sheet (row 1 is the header:
+# Timestamp | Date | User ID | Chat ID | Platform | URL | Status | Error Message).
+_COL_TIMESTAMP = 0
+_COL_DATE = 1
+_COL_USER_ID = 2
+_COL_CHAT_ID = 3
+_COL_PLATFORM = 4
+_COL_URL = 5
+_COL_STATUS = 6
+_COL_ERROR = 7
+
+
+def _truncate(text: str, max_bytes: int = 500) -> str:
+    """Truncate ``text`` to at most ``max_bytes`` UTF-8 bytes.
+
+    Slicing by code points lets multi-byte text (Cyrillic, emoji) blow past
+    the intended size on the wire; cutting on the encoded form bounds the
+    cell payload regardless of content. ``errors="ignore"`` drops a
+    character cut in half at the boundary.
+
+    :param text: Text to truncate.
+    :type text: str
+    :param max_bytes: Maximum size of the encoded result.
+    :type max_bytes: int
+    :return: Truncated text.
+    :rtype: str
+    """
+    encoded = text.encode("utf-8")
+    if len(encoded) <= max_bytes:
+        return text
+    return encoded[:max_bytes].decode("utf-8", "ignore")
+
+
+def _cell(row: list, index: int) -> str:
+    """Read a cell from a raw sheet row, tolerating ragged rows.
+
+    The values API omits trailing blank cells, so rows may be shorter than
+    the full column layout.
+
+    :param row: Raw row as returned by the values API.
+    :type row: list
+    :param index: Zero-based column index.
+    :type index: int
+    :return: Cell value, or ``""`` when the row is too short.
+    :rtype: str
+    """
+    return row[index] if len(row) > index else ""
+
 
 class GoogleSheetsStats:
     """Google Sheets stats client.
@@ -28,11 +91,13 @@ class GoogleSheetsStats:
     """
 
     def __init__(self) -> None:
-        """Initialize the Google Sheets client.
+        """Read configuration; no network I/O happens here.
 
         Reads credentials from ``GOOGLE_CREDENTIALS_JSON_BASE64`` and the sheet
-        id from ``GOOGLE_SHEETS_SPREADSHEET_ID``. Initialization failures are
-        logged as warnings and stats collection is disabled silently.
+        id from ``GOOGLE_SHEETS_SPREADSHEET_ID``. The actual OAuth/Sheets
+        connection is deferred to :meth:`_ensure_ready` so construction never
+        blocks the event-loop thread; connection failures are logged as
+        warnings and stats collection is disabled silently.
 
         :return: None
         """
@@ -41,62 +106,172 @@ class GoogleSheetsStats:
         self.worksheet: Optional[gspread.Worksheet] = None
         self._initialized = False
 
-        try:
-            credentials_json_b64 = os.getenv("GOOGLE_CREDENTIALS_JSON_BASE64")
-            spreadsheet_id = os.getenv("GOOGLE_SHEETS_SPREADSHEET_ID")
-
-            if not credentials_json_b64 or not spreadsheet_id:
-                logger.warning(
-                    "Google Sheets credentials not configured. "
-                    "Stats collection will be disabled."
-                )
-                logger.info(
-                    f"GOOGLE_CREDENTIALS_JSON_BASE64 present: {bool(credentials_json_b64)}, "
-                    f"GOOGLE_SHEETS_SPREADSHEET_ID present: {bool(spreadsheet_id)}"
-                )
-                return
+        # Event rows buffered for the next batched append; the flusher task
+        # is started lazily on the first logged event.
+        self._pending: "asyncio.Queue[list]" = asyncio.Queue()
+        self._flusher_task: Optional["asyncio.Task[None]"] = None
+        self._session: Optional[AuthorizedSession] = None
+
+        # Blocking Sheets HTTP calls run on this small dedicated pool so a
+        # burst of them can't crowd other users (file I/O, cleanup batches)
+        # out of asyncio's shared default executor. Threads spawn on demand.
+        self._executor = ThreadPoolExecutor(
+            max_workers=4, thread_name_prefix="gsheets"
+        )
+
+        # The events sheet is append-only, so rows fetched once never need
+        # re-fetching: get_stats pulls only rows past this watermark and
+        # folds them straight into per-date aggregate buckets, after which
+        # each call reads O(days) buckets instead of re-scanning every event.
+        # Process-local by design — the container is stateless and a restart
+        # just re-syncs once.
+        self._day_buckets: dict[str, dict] = {}
+        self._rows_fetched = 0
+
+        # Last computed stats dict, keyed by (days, cutoff date, watermark):
+        # if no rows arrived and the window hasn't rolled over, an admin
+        # polling /stats gets the cached result without re-aggregating.
+        self._cached_stats: Optional[dict] = None
+        self._cached_stats_key: Optional[tuple] = None
+
+        self._credentials_json_b64 = os.getenv("GOOGLE_CREDENTIALS_JSON_BASE64")
+        self._spreadsheet_id = os.getenv("GOOGLE_SHEETS_SPREADSHEET_ID")
+        self._configured = bool(self._credentials_json_b64 and self._spreadsheet_id)
+        self._init_failed = False
+        self._init_lock = asyncio.Lock()
+
+        if not self._configured:
+            logger.warning(
+                "Google Sheets credentials not configured. "
+                "Stats collection will be disabled."
+            )
+            logger.info(
+                "GOOGLE_CREDENTIALS_JSON_BASE64 present: %s, "
+                "GOOGLE_SHEETS_SPREADSHEET_ID present: %s",
+                bool(self._credentials_json_b64), bool(self._spreadsheet_id),
+            )
 
-            logger.info("Initializing Google Sheets stats...")
+    async def _ensure_ready(self) -> bool:
+        """Connect to Google Sheets on first use, off the event-loop thread.
 
-            credentials_json = base64.b64decode(credentials_json_b64).decode("utf-8")
-            credentials_dict = json.loads(credentials_json)
-            logger.debug(
-                f"Parsed credentials for project: {credentials_dict.get('project_id', 'unknown')}"
-            )
+        The blocking OAuth/Sheets handshake runs on the dedicated executor
+        exactly once; concurrent callers wait on the lock. A failed connect
+        disables stats for the process lifetime rather than retrying on
+        every event.
 
-            credentials = Credentials.from_service_account_info(
-                credentials_dict,
-                scopes=["https://www.googleapis.com/auth/spreadsheets"],
-            )
-            logger.debug("Service account credentials created")
+        :return: ``True`` when the client is ready to use.
+        :rtype: bool
+        """
+        if self._initialized:
+            return True
+        if not self._configured or self._init_failed:
+            return False
+
+        async with self._init_lock:
+            if self._initialized:
+                return True
+            if self._init_failed:
+                return False
+            try:
+                await self._run(self._connect)
+                self._initialized = True
+                logger.info("Google Sheets stats initialized successfully")
+                return True
+            except json.JSONDecodeError as e:
+                logger.warning("Failed to parse Google credentials JSON: %s", e)
+                logger.debug(
+                    "Ensure GOOGLE_CREDENTIALS_JSON_BASE64 is valid Base64-encoded JSON"
+                )
+            except gspread.exceptions.SpreadsheetNotFound:
+                logger.error(
+                    "Spreadsheet not found with ID: %s. "
+                    "Check GOOGLE_SHEETS_SPREADSHEET_ID or share the sheet with service account.",
+                    self._spreadsheet_id,
+                )
+            except gspread.exceptions.APIError as e:
+                logger.error("Google Sheets API error during initialization: %s", e)
+            except Exception as e:
+                logger.warning("Failed to initialize Google Sheets stats: %s", e)
+                logger.debug("Exception details: %s: %s", type(e).__name__, str(e))
+            self._init_failed = True
+            return False
 
-            self.client = gspread.authorize(credentials)
-            logger.debug("Google Sheets client authorized")
+    def _connect(self) -> None:
+        """Authorize and open the spreadsheet (blocking; runs on the executor).
 
-            self.spreadsheet = self.client.open_by_key(spreadsheet_id)
-            logger.info(f"Connected to spreadsheet: {self.spreadsheet.title}")
+        :return: None
+        """
+        logger.info("Initializing Google Sheets stats...")
+
+        credentials_json = base64.b64decode(self._credentials_json_b64).decode("utf-8")
+        credentials_dict = json.loads(credentials_json)
+        logger.debug(
+            "Parsed credentials for project: %s",
+            credentials_dict.get('project_id', 'unknown'),
+        )
+
+        credentials = Credentials.from_service_account_info(
+            credentials_dict,
+            scopes=["https://www.googleapis.com/auth/spreadsheets"],
+        )
+        logger.debug("Service account credentials created")
+
+        # One authorized session with a pooled keep-alive adapter for
+        # every Sheets call, so appends and stats reads reuse a warm
+        # TCP+TLS connection instead of handshaking per request. The
+        # adapter-level Retry covers transient 429/5xx responses.
+        session = AuthorizedSession(credentials)
+        session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=10,
+                pool_maxsize=32,
+                max_retries=Retry(
+                    total=5,
+                    backoff_factor=0.5,
+                    status_forcelist=[429, 500, 502, 503, 504],
+                ),
+            ),
+        )
+        self._session = session
+
+        self.client = gspread.authorize(credentials, session=session)
+        logger.debug("Google Sheets client authorized")
+
+        self.spreadsheet = self.client.open_by_key(self._spreadsheet_id)
+        logger.info("Connected to spreadsheet: %s", self.spreadsheet.title)
+
+        self.worksheet = self.spreadsheet.sheet1
+        logger.info("Using worksheet: %s", self.worksheet.title)
+
+    async def _run(self, fn, *args):
+        """Run a blocking Sheets call on the dedicated executor.
+
+        :param fn: Callable performing the blocking work.
+        :param args: Positional arguments passed to ``fn``.
+        :return: Whatever ``fn`` returns.
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, fn, *args
+        )
 
-            self.worksheet = self.spreadsheet.sheet1
-            logger.info(f"Using worksheet: {self.worksheet.title}")
+    async def warmup(self) -> None:
+        """Prime the Sheets connection so the first real call is warm.
 
-            self._initialized = True
-            logger.info("Google Sheets stats initialized successfully")
+        Triggers the lazy connect and one trivial read off the event loop,
+        paying the OAuth token fetch and TLS handshake at startup instead of
+        inside the first download log or admin ``/stats`` request. Failures
+        are logged and ignored — warming up is purely opportunistic.
 
-        except json.JSONDecodeError as e:
-            logger.warning(f"Failed to parse Google credentials JSON: {e}")
-            logger.debug(
-                "Ensure GOOGLE_CREDENTIALS_JSON_BASE64 is valid Base64-encoded JSON"
-            )
-        except gspread.exceptions.SpreadsheetNotFound:
-            logger.error(
-                f"Spreadsheet not found with ID: {spreadsheet_id}. "
-                "Check GOOGLE_SHEETS_SPREADSHEET_ID or share the sheet with service account."
-            )
-        except gspread.exceptions.APIError as e:
-            logger.error(f"Google Sheets API error during initialization: {e}")
+        :return: None
+        """
+        if not await self._ensure_ready():
+            return
+        try:
+            await self._run(self.worksheet.row_values, 1)
+            logger.info("Google Sheets connection warmed up")
         except Exception as e:
-            logger.warning(f"Failed to initialize Google Sheets stats: {e}")
-            logger.debug(f"Exception details: {type(e).__name__}: {str(e)}")
+            logger.warning("Google Sheets warmup failed: %s", e)
 
     async def log_download_success(
         self, user_id: int, chat_id: int, platform: str, url: str
@@ -113,15 +288,17 @@ class GoogleSheetsStats:
         :type url: str
         :return: None
         """
-        if not self._initialized:
+        if not await self._ensure_ready():
             logger.debug("Stats not initialized, skipping log_download_success")
             return
 
         try:
-            now = datetime.utcnow()
+            # Slicing the date out of the ISO timestamp skips a second
+            # datetime object and a locale-aware strftime per event.
+            iso = datetime.utcnow().isoformat(timespec="seconds") + "Z"
             row = [
-                now.isoformat() + "Z",
-                now.strftime("%Y-%m-%d"),
+                iso,
+                iso[:10],
                 str(user_id),
                 str(chat_id),
                 platform,
@@ -131,20 +308,16 @@ class GoogleSheetsStats:
             ]
 
             logger.debug(
-                f"Logging successful download: platform={platform}, user={user_id}, chat={chat_id}"
+                "Queued successful download: platform=%s, user=%s, chat=%s",
+                platform, user_id, chat_id,
             )
-            await asyncio.to_thread(self._append_row, row)
-            logger.info(f"Successfully logged {platform} download for user {user_id}")
+            self._enqueue_row(row=row)
 
-        except gspread.exceptions.APIError as e:
-            logger.error(f"Google Sheets API error while logging success: {e}")
-            logger.debug(
-                f"Failed to log download for user {user_id}, platform {platform}"
-            )
         except Exception as e:
-            logger.warning(f"Failed to log download success: {e}")
+            logger.warning("Failed to log download success: %s", e)
             logger.debug(
-                f"Exception type: {type(e).__name__}, user: {user_id}, platform: {platform}"
+                "Exception type: %s, user: %s, platform: %s",
+                type(e).__name__, user_id, platform,
             )
 
     async def log_download_error(
@@ -160,20 +333,21 @@ class GoogleSheetsStats:
         :type platform: str
         :param url: Video URL.
         :type url: str
-        :param error_msg: Error message (truncated to 500 chars before writing).
+        :param error_msg: Error message (truncated to 500 UTF-8 bytes before
+            writing).
         :type error_msg: str
         :return: None
         """
-        if not self._initialized:
+        if not await self._ensure_ready():
             logger.debug("Stats not initialized, skipping log_download_error")
             return
 
         try:
-            now = datetime.utcnow()
-            truncated_error = error_msg[:500] if error_msg else "Unknown error"
+            iso = datetime.utcnow().isoformat(timespec="seconds") + "Z"
+            truncated_error = _truncate(error_msg) if error_msg else "Unknown error"
             row = [
-                now.isoformat() + "Z",
-                now.strftime("%Y-%m-%d"),
+                iso,
+                iso[:10],
                 str(user_id),
                 str(chat_id),
                 platform,
@@ -183,31 +357,183 @@ class GoogleSheetsStats:
             ]
 
             logger.debug(
-                f"Logging download error: platform={platform}, user={user_id}, error={truncated_error[:50]}..."
-            )
-            await asyncio.to_thread(self._append_row, row)
-            logger.info(
-                f"Successfully logged {platform} download error for user {user_id}"
+                "Queued download error: platform=%s, user=%s, error=%s...",
+                platform,
+                user_id,
+                truncated_error[:50],
             )
+            self._enqueue_row(row=row)
 
-        except gspread.exceptions.APIError as e:
-            logger.error(f"Google Sheets API error while logging error: {e}")
-            logger.debug(f"Failed to log error for user {user_id}, platform {platform}")
         except Exception as e:
-            logger.warning(f"Failed to log download error: {e}")
+            logger.warning("Failed to log download error: %s", e)
             logger.debug(
-                f"Exception type: {type(e).__name__}, user: {user_id}, platform: {platform}"
+                "Exception type: %s, user: %s, platform: %s",
+                type(e).__name__, user_id, platform,
             )
 
-    def _append_row(self, row: list) -> None:
-        """Append a row to the worksheet synchronously.
+    def _enqueue_row(self, row: list) -> None:
+        """Buffer an event row for the next batched append.
+
+        Starts the flusher task on first use — nothing here touches the
+        network, so the request path pays only a queue append.
 
         :param row: List of values to append.
         :type row: list
         :return: None
         """
-        if self.worksheet:
-            self.worksheet.append_row(row, value_input_option="RAW")
+        self._pending.put_nowait(row)
+        if self._flusher_task is None or self._flusher_task.done():
+            self._flusher_task = asyncio.create_task(self._flush_loop())
+
+    async def _flush_loop(self) -> None:
+        """Flush batches when they fill up or their flush interval elapses.
+
+        Nagle-style coalescing: a lone event after a quiet period waits at
+        most one interval, while a burst grows the batch up to the size cap
+        before the single ``append_rows`` call.
+
+        :return: None
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            rows = [await self._pending.get()]
+            try:
+                deadline = loop.time() + _FLUSH_INTERVAL_SECONDS
+                while len(rows) < _FLUSH_MAX_ROWS:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        rows.append(
+                            await asyncio.wait_for(
+                                self._pending.get(), timeout=timeout
+                            )
+                        )
+                    except asyncio.TimeoutError:
+                        break
+            except asyncio.CancelledError:
+                # Shutdown hit mid-coalesce: put the partial batch back so
+                # aclose's final drain writes it instead of losing it.
+                for row in rows:
+                    self._pending.put_nowait(row)
+                raise
+            await self._flush_rows(rows=rows)
+
+    async def _flush_pending(self) -> None:
+        """Drain the queue and write whatever is buffered right now.
+
+        Used at shutdown; the running flusher otherwise owns the queue.
+
+        :return: None
+        """
+        rows: list[list] = []
+        while not self._pending.empty():
+            rows.append(self._pending.get_nowait())
+        if rows:
+            await self._flush_rows(rows=rows)
+
+    async def _flush_rows(self, rows: list[list]) -> None:
+        """Write one batch of rows in a single ``append_rows`` call.
+
+        Quota errors (HTTP 429) requeue the batch so the next flush cycle —
+        a full interval later — retries it; the session's adapter-level
+        Retry has already backed off by then. Other failures are logged and
+        the batch is dropped — stats must never affect the main bot flow.
+
+        :param rows: Batch of event rows.
+        :type rows: list[list]
+        :return: None
+        """
+        try:
+            # _ensure_ready gates every producer, so self.worksheet is set
+            # by the time anything reaches the queue.
+            await self._run(
+                partial(self.worksheet.append_rows, rows, value_input_option="RAW")
+            )
+            logger.info("Flushed %s stats rows to Google Sheets", len(rows))
+        except gspread.exceptions.APIError as e:
+            status = getattr(getattr(e, "response", None), "status_code", None)
+            if status == 429 and self._pending.qsize() < _REQUEUE_LIMIT_ROWS:
+                for row in rows:
+                    self._pending.put_nowait(row)
+                logger.warning(
+                    "Sheets write quota hit, requeued %s rows for the next flush",
+                    len(rows),
+                )
+            else:
+                logger.error("Google Sheets API error while flushing rows: %s", e)
+        except Exception as e:
+            logger.warning("Failed to flush %s stats rows: %s", len(rows), e)
+
+    def _ingest_rows(self, rows: list[list]) -> None:
+        """Fold raw event rows into the per-date aggregate buckets.
+
+        :param rows: Raw rows as returned by the values API.
+        :type rows: list[list]
+        :return: None
+        """
+        for row in rows:
+            date = _cell(row, _COL_DATE)
+            if not date:
+                continue
+
+            bucket = self._day_buckets.get(date)
+            if bucket is None:
+                bucket = {
+                    "total": 0,
+                    "success": 0,
+                    "errors": 0,
+                    "chats": set(),
+                    "error_types": Counter(),
+                }
+                self._day_buckets[date] = bucket
+
+            bucket["total"] += 1
+            if _cell(row, _COL_STATUS) == "success":
+                bucket["success"] += 1
+            else:
+                bucket["errors"] += 1
+                error = _cell(row, _COL_ERROR)
+                if error:
+                    bucket["error_types"][error] += 1
+            bucket["chats"].add(_cell(row, _COL_CHAT_ID))
+
+    def _fetch_new_rows(self) -> list[list]:
+        """Fetch event rows appended to the sheet since the last sync.
+
+        Pulls only the range past the in-memory watermark, so repeated
+        ``get_stats`` calls cost O(new rows) in transfer instead of
+        re-serializing the whole ever-growing sheet.
+
+        :return: New raw rows; possibly ragged, since the values API omits
+            trailing blank cells.
+        :rtype: list[list]
+        """
+        if not self.worksheet:
+            return []
+        # +1 for the header row, +1 to start past the last cached row.
+        start_row = self._rows_fetched + 2
+        return self.worksheet.get(f"A{start_row}:H") or []
+
+    async def aclose(self) -> None:
+        """Stop the flusher and write out anything still buffered.
+
+        Called once during shutdown.
+
+        :return: None
+        """
+        if self._flusher_task is not None:
+            self._flusher_task.cancel()
+            # Wait for the flusher to actually stop (re-queuing any batch it
+            # was coalescing) before the final drain below.
+            try:
+                await self._flusher_task
+            except asyncio.CancelledError:
+                pass
+        await self._flush_pending()
+        if self._session is not None:
+            self._session.close()
+        self._executor.shutdown(wait=False)
 
     async def get_stats(self, days: int = 30) -> Optional[dict]:
         """Return aggregated stats for the last ``days`` days.
@@ -218,19 +544,23 @@ class GoogleSheetsStats:
             or the API call fails.
         :rtype: Optional[dict]
         """
-        if not self._initialized:
+        if not await self._ensure_ready():
             logger.warning("Google Sheets not initialized, cannot get stats")
             return None
 
         try:
-            logger.info(f"Fetching stats for last {days} days...")
+            logger.info("Fetching stats for last %s days...", days)
 
-            all_records = await asyncio.to_thread(self.worksheet.get_all_records)
+            new_rows = await self._run(self._fetch_new_rows)
+            if new_rows:
+                self._ingest_rows(rows=new_rows)
+                self._rows_fetched += len(new_rows)
             logger.debug(
-                f"Retrieved {len(all_records)} total records from Google Sheets"
+                "Fetched %s new rows, %s day buckets",
+                len(new_rows), len(self._day_buckets),
             )
 
-            if not all_records:
+            if not self._day_buckets:
                 logger.info("No records found in Google Sheets")
                 return {
                     "total": 0,
@@ -243,58 +573,53 @@ class GoogleSheetsStats:
 
             cutoff_date = datetime.utcnow() - timedelta(days=days)
             cutoff_str = cutoff_date.strftime("%Y-%m-%d")
-            logger.debug(f"Filtering records from {cutoff_str} onwards")
 
-            filtered_records = [
-                r for r in all_records if r.get("Date", "") >= cutoff_str
-            ]
-            logger.info(
-                f"Filtered to {len(filtered_records)} records within {days} days"
-            )
+            cache_key = (days, cutoff_str, self._rows_fetched)
+            if self._cached_stats is not None and cache_key == self._cached_stats_key:
+                logger.debug("Sheet unchanged since last call, using cached stats")
+                return self._cached_stats
 
-            total = len(filtered_records)
-            success = sum(1 for r in filtered_records if r.get("Status") == "success")
-            errors = sum(1 for r in filtered_records if r.get("Status") == "error")
+            logger.debug("Aggregating buckets from %s onwards", cutoff_str)
 
-            unique_chats = len(set(str(r.get("Chat ID", "")) for r in filtered_records))
+            selected = {
+                date: bucket
+                for date, bucket in self._day_buckets.items()
+                if date >= cutoff_str
+            }
 
-            error_messages = [
-                r.get("Error Message", "Unknown error")
-                for r in filtered_records
-                if r.get("Status") == "error" and r.get("Error Message")
-            ]
-            error_counter = Counter(error_messages)
+            total = success = errors = 0
+            chats: set = set()
+            error_counter: Counter = Counter()
+            for bucket in selected.values():
+                total += bucket["total"]
+                success += bucket["success"]
+                errors += bucket["errors"]
+                chats |= bucket["chats"]
+                error_counter.update(bucket["error_types"])
+            unique_chats = len(chats)
             error_types = dict(error_counter.most_common(5))
 
-            daily_data = {}
-            for record in filtered_records:
-                date = record.get("Date", "")
-                if not date:
-                    continue
-
-                if date not in daily_data:
-                    daily_data[date] = {"total": 0, "success": 0, "errors": 0}
-
-                daily_data[date]["total"] += 1
-                if record.get("Status") == "success":
-                    daily_data[date]["success"] += 1
-                else:
-                    daily_data[date]["errors"] += 1
-
             daily_stats = [
-                {"date": date, **stats}
-                for date, stats in sorted(
-                    daily_data.items(), key=lambda x: x[0], reverse=True
-                )
+                {
+                    "date": date,
+                    # dd.mm for display, sliced straight out of the ISO date
+                    # so the formatter needn't strptime every row again.
+                    "date_formatted": f"{date[8:10]}.{date[5:7]}",
+                    "total": bucket["total"],
+                    "success": bucket["success"],
+                    "errors": bucket["errors"],
+                }
+                for date, bucket in sorted(selected.items(), reverse=True)
             ]
 
             logger.info(
-                f"Stats calculated: total={total}, success={success}, errors={errors}, "
-                f"unique_chats={unique_chats}, error_types={len(error_types)}"
+                "Stats calculated: total=%s, success=%s, errors=%s, "
+                "unique_chats=%s, error_types=%s",
+                total, success, errors, unique_chats, len(error_types),
             )
-            logger.debug(f"Daily stats for {len(daily_stats)} days")
+            logger.debug("Daily stats for %s days", len(daily_stats))
 
-            return {
+            stats = {
                 "total": total,
                 "success": success,
                 "errors": errors,
@@ -302,13 +627,16 @@ class GoogleSheetsStats:
                 "error_types": error_types,
                 "daily_stats": daily_stats[:7],
             }
+            self._cached_stats = stats
+            self._cached_stats_key = cache_key
+            return stats
 
         except gspread.exceptions.APIError as e:
-            logger.error(f"Google Sheets API error while getting stats: {e}")
+            logger.error("Google Sheets API error while getting stats: %s", e)
             return None
         except Exception as e:
-            logger.error(f"Failed to get stats from Google Sheets: {e}")
-            logger.debug(f"Exception type: {type(e).__name__}: {str(e)}")
+            logger.error("Failed to get stats from Google Sheets: %s", e)
+            logger.debug("Exception type: %s: %s", type(e).__name__, str(e))
             return None
 
     @staticmethod
@@ -331,28 +659,30 @@ class GoogleSheetsStats:
         success_rate = (success / total * 100) if total > 0 else 0
         error_rate = (errors / total * 100) if total > 0 else 0
 
-        message = f"""📊 <b>Статистика за последние 30 дней</b>
+        # Collected into a list and joined once — += in a loop re-copies the
+        # whole message on every append.
+        parts = [
+            f"""📊 <b>Статистика за последние 30 дней</b>
 
 📥 Всего запросов: {total:,}
 ✅ Успешно: {success:,} ({success_rate:.1f}%)
 ❌ Ошибок: {errors:,} ({error_rate:.1f}%)
 
 👥 Уникальных чатов: {unique_chats}"""
+        ]
 
         if stats["error_types"]:
-            message += "\n\n🔝 <b>Типы ошибок:</b>"
+            parts.append("\n\n🔝 <b>Типы ошибок:</b>")
             for error_msg, count in list(stats["error_types"].items())[:5]:
                 short_msg = error_msg[:60] + "..." if len(error_msg) > 60 else error_msg
-                message += f"\n• {short_msg}: {count}"
+                parts.append(f"\n• {short_msg}: {count}")
 
         if stats["daily_stats"]:
-            message += "\n\n📈 <b>По дням (последние 7):</b>"
+            parts.append("\n\n📈 <b>По дням (последние 7):</b>")
             for day_stat in stats["daily_stats"]:
-                date_obj = datetime.strptime(day_stat["date"], "%Y-%m-%d")
-                date_formatted = date_obj.strftime("%d.%m")
-                message += (
-                    f"\n{date_formatted}: {day_stat['total']} "
+                parts.append(
+                    f"\n{day_stat['date_formatted']}: {day_stat['total']} "
                     f"(✓{day_stat['success']} ✗{day_stat['errors']})"
                 )
 
-        return message
+        return "".join(parts)
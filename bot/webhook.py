@@ -49,21 +49,22 @@ def make_webhook_handler(
         provided_secret = request.headers.get(TELEGRAM_SECRET_HEADER, "")
         if not hmac.compare_digest(provided_secret, webhook_secret):
             logger.warning(
-                f"Webhook request with invalid or missing secret token "
-                f"from {request.remote}"
+                "Webhook request with invalid or missing secret token "
+                "from %s",
+                request.remote,
             )
             return web.Response(status=401, text="unauthorized")
 
         try:
             payload = await request.json()
         except Exception as e:
-            logger.warning(f"Failed to parse webhook payload as JSON: {e}")
+            logger.warning("Failed to parse webhook payload as JSON: %s", e)
             return web.Response(status=400, text="bad request")
 
         try:
             update = Update.model_validate(payload, context={"bot": bot})
         except Exception as e:
-            logger.warning(f"Failed to validate Telegram update: {e}")
+            logger.warning("Failed to validate Telegram update: %s", e)
             return web.Response(status=400, text="bad request")
 
         try:
@@ -72,7 +73,7 @@ def make_webhook_handler(
             # feed_webhook_update normally swallows handler errors, but defend
             # against unexpected dispatcher-level failures so we do not leak 500s
             # to Telegram (Telegram would keep retrying).
-            logger.exception(f"Unhandled dispatcher error: {e}")
+            logger.exception("Unhandled dispatcher error: %s", e)
 
         return web.Response(status=200, text="ok")
 